@@ -1,5 +1,6 @@
 import collections.abc
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
@@ -151,6 +152,18 @@ def infer_params(
     return {**super_parameters, **parameters}  # Subclass parameters overwrite superclass ones
 
 
+@lru_cache(maxsize=None)
+def _cached_infer_params(
+    cls: Type[T], constructor: Union[Callable[..., T], Callable[[T], None]]
+) -> Dict[str, Any]:
+    """
+    Memoized version of [`infer_params`](./#infer_params).  Signatures don't change after a class
+    is defined, and `inspect.signature` is slow, so we only want to do this once per
+    class / constructor pair.  Callers must not modify the returned dictionary.
+    """
+    return infer_params(cls, constructor)
+
+
 def create_kwargs(
     constructor: Callable[..., T], cls: Type[T], params: Params, **extras
 ) -> Dict[str, Any]:
@@ -169,7 +182,7 @@ def create_kwargs(
 
     kwargs: Dict[str, Any] = {}
 
-    parameters = infer_params(cls, constructor)
+    parameters = _cached_infer_params(cls, constructor)
     accepts_kwargs = False
 
     # Iterate over all the constructor parameters and their annotations.
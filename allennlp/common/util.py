@@ -723,7 +723,7 @@ def cycle_iterator_function(iterator_function: Callable[[], Iterable[T]]) -> Ite
 
 def hash_object(o: Any) -> str:
     """Returns a 32-character hash code of arbitrary Python objects."""
-    m = hashlib.blake2b()
+    m = hashlib.blake2b(digest_size=16)
     with io.BytesIO() as buffer:
         pickle.dump(o, buffer)
         m.update(buffer.getbuffer())
@@ -161,6 +161,12 @@ class TestCommonUtils(AllenNlpTestCase):
         # 1 here with itertools.cycle.
         assert cycle_iterator_function_calls == 3
 
+    def test_hash_object(self):
+        h = util.hash_object({"a": [1, 2, 3], "b": "foo"})
+        assert len(h) == 32
+        assert h == util.hash_object({"a": [1, 2, 3], "b": "foo"})
+        assert h != util.hash_object({"a": [1, 2, 3], "b": "bar"})
+
 
 @pytest.mark.parametrize(
     "size, result",